@@ -13,6 +13,7 @@ The displacement map is a 2D array where:
     - Negative = recessed below surface (background purl texture)
 """
 
+import functools
 import numpy as np
 import math
 from .parameters import (
@@ -23,6 +24,13 @@ from .parameters import (
 )
 
 
+# Working precision for the strand/Gaussian math and the displacement map.
+# STL stores float32, so this halves memory traffic on the heavy ufuncs.
+# Positions, distances and the hard cutoffs (rope width, lookup keys)
+# stay float64: float32 rounding there flips cells across the cutoffs.
+DTYPE = np.float32
+
+
 def generate_displacement_map(params: RollerParams) -> np.ndarray:
     """Generate the full displacement map for the given parameters.
 
@@ -42,6 +50,80 @@ def generate_displacement_map(params: RollerParams) -> np.ndarray:
         return _generate_spiral(params)
 
 
+@functools.lru_cache(maxsize=4)
+def _angular_positions(angular_steps: int) -> np.ndarray:
+    """Angle (radians) of each column around the circumference, cached.
+
+    Shared by coordinate_grids and _twist_angles. Returned read-only.
+    """
+    theta_1d = np.linspace(0, 2.0 * math.pi, angular_steps, endpoint=False)
+    theta_1d.setflags(write=False)
+    return theta_1d
+
+
+@functools.lru_cache(maxsize=4)
+def coordinate_grids(width: float, axial_steps: int, angular_steps: int) -> tuple:
+    """Build (and cache) the coordinate grids for a roller surface mesh.
+
+    The spiral and tangent generators and the STL vertex step all work on
+    the same (axial_steps x angular_steps) grid, so it is built once per
+    size and shared. The returned arrays are read-only.
+
+    Args:
+        width: Roller width in mm.
+        axial_steps: Number of rows (Z positions).
+        angular_steps: Number of columns (theta positions).
+
+    Returns:
+        Tuple of (z_1d, theta_1d, z_grid, theta_grid, cos_theta, sin_theta).
+        z_grid/theta_grid have shape (axial_steps, angular_steps); the rest
+        are 1D. cos_theta/sin_theta are per column, for broadcasting.
+    """
+    # z_1d[i] = axial position for row i
+    # theta_1d[j] = angle for column j
+    z_1d = np.linspace(0, width, axial_steps)
+    theta_1d = _angular_positions(angular_steps)
+    z_grid, theta_grid = np.meshgrid(z_1d, theta_1d, indexing='ij')
+    cos_theta = np.cos(theta_1d)
+    sin_theta = np.sin(theta_1d)
+
+    grids = (z_1d, theta_1d, z_grid, theta_grid, cos_theta, sin_theta)
+    for arr in grids:
+        arr.setflags(write=False)
+    return grids
+
+
+@functools.lru_cache(maxsize=32)
+def _twist_angles(angular_steps: int, twist_rate: int) -> tuple:
+    """sin/cos of the rope twist angle at each angular position.
+
+    twist_rate is an integer slider, so slider sweeps revisit the same few
+    values; results are cached and returned read-only.
+
+    Args:
+        angular_steps: Number of columns (theta positions).
+        twist_rate: Rope twists per circumference.
+
+    Returns:
+        Tuple of 1D arrays (sin_twist, cos_twist).
+    """
+    theta_1d = _angular_positions(angular_steps)
+
+    # Arc position along circumference for each angular step
+    arc_pos = theta_1d * RADIUS
+
+    # Rope twist angle at each angular position
+    rope_twist_angles = (arc_pos / CIRCUMFERENCE) * twist_rate * 2.0 * math.pi
+
+    twist = (
+        np.sin(rope_twist_angles).astype(DTYPE),
+        np.cos(rope_twist_angles).astype(DTYPE),
+    )
+    for arr in twist:
+        arr.setflags(write=False)
+    return twist
+
+
 def _generate_background(z_values: np.ndarray, theta_values: np.ndarray) -> np.ndarray:
     """Generate the background purl (knit) texture.
 
@@ -83,105 +165,194 @@ def _generate_spiral(params: RollerParams) -> np.ndarray:
     strand_orbit = params.strand_orbit
     pitch = params.pitch
 
-    # Pre-compute coordinate grids
-    # z_vals[i] = axial position for row i
-    # theta_vals[j] = angle for column j
-    z_1d = np.linspace(0, width, axial_steps)
-    theta_1d = np.linspace(0, 2.0 * math.pi, angular_steps, endpoint=False)
-    z_grid, theta_grid = np.meshgrid(z_1d, theta_1d, indexing='ij')
+    # Pre-computed coordinate grids (shared, read-only)
+    z_1d, theta_1d, z_grid, theta_grid, _, _ = coordinate_grids(
+        width, axial_steps, angular_steps
+    )
 
     # Start with background texture
-    displacement = _generate_background(z_grid, theta_grid)
+    displacement = _generate_background(z_grid, theta_grid).astype(DTYPE)
+
+    # Rope twist angle sin/cos at each angular position (cached)
+    sin_twist_1d, cos_twist_1d = _twist_angles(angular_steps, twist_rate)
+
+    # All wraps are processed together: they share the same grids and
+    # differ only by a constant axial shift of their centerline.
+    wrap_offsets = np.arange(num_wraps) * pitch  # shape: (num_wraps,)
+
+    # For each wrap and angular position, calculate where that spiral's
+    # centerline crosses (its Z position)
+    # Shape: (num_wraps, angular_steps)
+    z_spiral_centers = (
+        ((theta_1d / (2.0 * math.pi)) * pitch)[np.newaxis, :]
+        + wrap_offsets[:, np.newaxis]
+    ) % width
+
+    # Distance from each grid point to each spiral centerline
+    # z_grid shape: (axial, angular) → dz shape: (num_wraps, axial, angular)
+    dz = z_grid[np.newaxis, :, :] - z_spiral_centers[:, np.newaxis, :]
+
+    # Handle wrapping at roller edges: fold dz into [-width/2, width/2]
+    # in one branchless pass (round-half-even keeps +width/2 as-is)
+    dz -= width * np.round(dz / width)
+
+    # Only process points close enough to a rope
+    close_mask = np.abs(dz) < rope_width
+
+    # Nothing to add if no points are close to any wrap
+    if not np.any(close_mask):
+        return displacement
+
+    # The rope math below only runs on the close points (a narrow band
+    # around each centerline), as flat 1D arrays
+    dz_close = dz[close_mask].astype(DTYPE)
+
+    # Calculate strand contributions
+    # We need rope_twist_angle for each angular position; its sin/cos are
+    # combined with each strand's base angle below.
+    # Gathered per close point: shape (num_close,)
+    sin_twist = np.broadcast_to(sin_twist_1d, dz.shape)[close_mask]
+    cos_twist = np.broadcast_to(cos_twist_1d, dz.shape)[close_mask]
+
+    # Gaussian falloff coefficients: exp(-d^2 * inv_sigma2)
+    inv_strand_sigma2 = 1.0 / (STRAND_RADIUS * 0.8) ** 2
+    inv_envelope_sigma2 = 1.0 / (rope_width / 3.0) ** 2
+
+    # Running strand reductions: max height, total influence and the
+    # influence-weighted height sum (no per-strand buffers are kept)
+    max_strand = np.full(dz_close.shape, -np.inf, dtype=DTYPE)
+    total_influence = np.zeros(dz_close.shape, dtype=DTYPE)
+    weighted_sum = np.zeros(dz_close.shape, dtype=DTYPE)
+
+    # Scratch buffers reused by every strand
+    strand_influence = np.empty(dz_close.shape, dtype=DTYPE)
+    strand_height = np.empty(dz_close.shape, dtype=DTYPE)
+
+    for s in range(num_strands):
+        base_angle = s * (2.0 * math.pi / num_strands)
+        sin_base = math.sin(base_angle)
+        cos_base = math.cos(base_angle)
+
+        # Strand offset from rope centerline
+        # (angle-sum identities for strand_angle = base_angle + twist_angle)
+        strand_offset_z = strand_orbit * (
+            sin_base * cos_twist + cos_base * sin_twist
+        )
+        strand_offset_radial = strand_orbit * (
+            cos_base * cos_twist - sin_base * sin_twist
+        )
 
-    # Arc position along circumference for each angular step
-    arc_pos = theta_1d * RADIUS  # shape: (angular_steps,)
+        # Gaussian influence falloff from this strand
+        np.subtract(dz_close, strand_offset_z, out=strand_influence)
+        np.square(strand_influence, out=strand_influence)
+        strand_influence *= -inv_strand_sigma2
+        np.exp(strand_influence, out=strand_influence)
 
-    # Rope twist angle at each angular position
-    rope_twist_angles = (arc_pos / CIRCUMFERENCE) * twist_rate * 2.0 * math.pi
+        # Strand height contribution
+        np.multiply(strand_influence, STRAND_RADIUS, out=strand_height)
+        strand_height += rope_depth
+        strand_height += strand_offset_radial
 
-    # Process each spiral wrap
-    for spiral_start in range(num_wraps):
-        # For each angular position, calculate where this spiral's
-        # centerline crosses (its Z position)
-        # Shape: (angular_steps,)
-        z_spiral_centers = (
-            (theta_1d / (2.0 * math.pi)) * pitch + spiral_start * pitch
-        ) % width
-
-        # Distance from each grid point to this spiral centerline
-        # z_grid shape: (axial, angular), z_spiral_centers shape: (angular,)
-        dz = z_grid - z_spiral_centers[np.newaxis, :]
-
-        # Handle wrapping at roller edges
-        dz = np.where(dz > width / 2, dz - width, dz)
-        dz = np.where(dz < -width / 2, dz + width, dz)
-
-        # Only process points close enough to this rope
-        close_mask = np.abs(dz) < rope_width
-
-        # Skip this wrap entirely if no points are close
-        if not np.any(close_mask):
-            continue
-
-        # Calculate strand contributions
-        # We need rope_twist_angle for each angular position
-        # Broadcast to match grid: shape (1, angular_steps)
-        twist_angles = rope_twist_angles[np.newaxis, :]
-
-        # Accumulate strand heights and influences
-        strand_heights_all = np.zeros((num_strands, axial_steps, angular_steps))
-        strand_influences_all = np.zeros((num_strands, axial_steps, angular_steps))
-
-        for s in range(num_strands):
-            base_angle = s * (2.0 * math.pi / num_strands)
-            strand_angle = base_angle + twist_angles
-
-            # Strand offset from rope centerline
-            strand_offset_z = strand_orbit * np.sin(strand_angle)
-            strand_offset_radial = strand_orbit * np.cos(strand_angle)
-
-            # Distance from point to this strand
-            dz_to_strand = dz - strand_offset_z
-            dist_to_strand = np.abs(dz_to_strand)
-
-            # Gaussian influence falloff
-            strand_influence = np.exp(
-                -(dist_to_strand ** 2) / (STRAND_RADIUS * 0.8) ** 2
-            )
-
-            # Strand height contribution
-            strand_height = (
-                rope_depth + strand_offset_radial + STRAND_RADIUS * strand_influence
-            )
-
-            strand_heights_all[s] = strand_height
-            strand_influences_all[s] = strand_influence
-
-        # Blend strands based on smoothing parameter
-        max_strand = np.max(strand_heights_all, axis=0)
-        total_influence = np.sum(strand_influences_all, axis=0)
-        weighted_sum = np.sum(
-            strand_heights_all * strand_influences_all, axis=0
-        )
-        weighted_avg = weighted_sum / (total_influence + 0.001)
+        np.maximum(max_strand, strand_height, out=max_strand)
+        total_influence += strand_influence
+        strand_influence *= strand_height
+        weighted_sum += strand_influence
 
-        blended_height = (1.0 - smoothing) * max_strand + smoothing * weighted_avg
+    # Blend strands based on smoothing parameter
+    weighted_avg = weighted_sum / (total_influence + 0.001)
 
-        # Rope envelope — Gaussian falloff from rope center
-        rope_envelope = np.exp(-(dz ** 2) / (rope_width / 3.0) ** 2)
-        rope_base = rope_depth * rope_envelope
-        contribution = np.maximum(blended_height * rope_envelope, rope_base)
+    blended_height = (1.0 - smoothing) * max_strand + smoothing * weighted_avg
 
-        # Only apply where points are close to this rope
-        displacement = np.where(
-            close_mask,
-            np.maximum(displacement, contribution),
-            displacement
-        )
+    # Rope envelope — Gaussian falloff from rope center
+    rope_envelope = np.square(dz_close)
+    rope_envelope *= -inv_envelope_sigma2
+    np.exp(rope_envelope, out=rope_envelope)
+    rope_base = rope_depth * rope_envelope
+
+    # Scatter back so points far from a rope never win, then keep the
+    # strongest wrap at every grid point
+    contribution = np.full(dz.shape, -np.inf, dtype=DTYPE)
+    contribution[close_mask] = np.maximum(blended_height * rope_envelope, rope_base)
+    np.maximum(displacement, np.max(contribution, axis=0), out=displacement)
 
     return displacement
 
 
+def _ring_pattern(
+    sin_twist: np.ndarray,
+    cos_twist: np.ndarray,
+    dist_steps: np.ndarray,
+    params: RollerParams,
+) -> np.ndarray:
+    """Calculate one tangent ring's height at every angle and distance.
+
+    This is the lookup table used by tangent mode: every ring is identical,
+    so its pattern is computed once and then placed at each ring center.
+
+    Args:
+        sin_twist: 1D array of sin(rope twist angle) per angular position.
+        cos_twist: 1D array of cos(rope twist angle) per angular position.
+        dist_steps: 1D float64 array of axial distances from the ring
+            center (mm).
+        params: Current roller parameters.
+
+    Returns:
+        2D array of shape (angular_steps, num_dist_steps) containing
+        ring heights in mm (0 at or beyond the rope width).
+    """
+    rope_width = params.rope_width
+    rope_depth = params.rope_depth
+    num_strands = params.num_strands
+    smoothing = params.smoothing_fraction
+    strand_orbit = params.strand_orbit
+
+    # Evaluated as one broadcast over (angular, distance, strand)
+    base_angles = np.arange(num_strands, dtype=DTYPE) * (2.0 * math.pi / num_strands)
+    sin_base = np.sin(base_angles)[np.newaxis, np.newaxis, :]
+    cos_base = np.cos(base_angles)[np.newaxis, np.newaxis, :]
+    sin_twist = sin_twist[:, np.newaxis, np.newaxis]
+    cos_twist = cos_twist[:, np.newaxis, np.newaxis]
+
+    # Strand offset from ring centerline
+    # (angle-sum identities for strand_angle = base_angle + twist_angle)
+    strand_offset_z = strand_orbit * (sin_base * cos_twist + cos_base * sin_twist)
+    strand_offset_radial = strand_orbit * (cos_base * cos_twist - sin_base * sin_twist)
+
+    # Distance from each lookup distance to each strand
+    dist = dist_steps.astype(DTYPE)
+    dz_to_strand = dist[np.newaxis, :, np.newaxis] - np.abs(strand_offset_z)
+    dist_to_strand = np.abs(dz_to_strand)
+
+    # Gaussian influence falloff
+    strand_influence = np.exp(
+        -(dist_to_strand ** 2) / (STRAND_RADIUS * 0.8) ** 2
+    )
+
+    # Strand height contribution
+    strand_height = (
+        rope_depth + strand_offset_radial + STRAND_RADIUS * strand_influence
+    )
+
+    # Blend strands (reduce along the strand axis)
+    max_strand = np.max(strand_height, axis=2)
+    total_influence = np.sum(strand_influence, axis=2)
+    # Multiply and reduce in one pass (no (angular, distance, strand) product)
+    weighted_sum = np.einsum('ads,ads->ad', strand_height, strand_influence)
+    weighted_avg = weighted_sum / (total_influence + 0.001)
+    blended_height = (1.0 - smoothing) * max_strand + smoothing * weighted_avg
+
+    # Rope envelope — depends only on distance from ring center
+    rope_envelope = np.exp(-(dist ** 2) / (rope_width / 3.0) ** 2)
+    rope_envelope = rope_envelope[np.newaxis, :]
+    rope_base = rope_depth * rope_envelope
+    ring_pattern = np.maximum(blended_height * rope_envelope, rope_base)
+
+    # Points at or beyond the rope width get no contribution
+    ring_pattern[:, dist_steps >= rope_width] = 0.0
+
+    return ring_pattern
+
+
 def _generate_tangent(params: RollerParams) -> np.ndarray:
     """Generate displacement map for tangent (horizontal ring) mode.
 
@@ -196,12 +367,8 @@ def _generate_tangent(params: RollerParams) -> np.ndarray:
 
     width = params.width
     rope_width = params.rope_width
-    rope_depth = params.rope_depth
     num_wraps = params.num_wraps
     twist_rate = params.twist_rate
-    num_strands = params.num_strands
-    smoothing = params.smoothing_fraction
-    strand_orbit = params.strand_orbit
     z_step = width / num_wraps
 
     # Pre-calculate one ring's pattern for all angular positions
@@ -211,91 +378,37 @@ def _generate_tangent(params: RollerParams) -> np.ndarray:
     dist_steps = np.arange(0, max_dist + 0.5, 0.5)
     num_dist_steps = len(dist_steps)
 
+    # Pre-computed coordinate grids (shared, read-only)
+    z_1d, _, z_grid, theta_grid, _, _ = coordinate_grids(
+        width, axial_steps, angular_steps
+    )
+
     # For each angular position, calculate pattern at each distance
-    theta_1d = np.linspace(0, 2.0 * math.pi, angular_steps, endpoint=False)
-    arc_pos = theta_1d * RADIUS
-    rope_twist_angles = (arc_pos / CIRCUMFERENCE) * twist_rate * 2.0 * math.pi
+    sin_twist, cos_twist = _twist_angles(angular_steps, twist_rate)
 
     # ring_pattern[j, d] = height at angular position j, distance index d
-    ring_pattern = np.zeros((angular_steps, num_dist_steps))
-
-    for j in range(angular_steps):
-        twist_angle = rope_twist_angles[j]
-
-        for d_idx, dist_to_ring in enumerate(dist_steps):
-            if dist_to_ring >= rope_width:
-                ring_pattern[j, d_idx] = 0.0
-                continue
-
-            strand_heights = []
-            strand_influences = []
-
-            for s in range(num_strands):
-                base_angle = s * (2.0 * math.pi / num_strands)
-                strand_angle = base_angle + twist_angle
-
-                strand_offset_z = strand_orbit * math.sin(strand_angle)
-                strand_offset_radial = strand_orbit * math.cos(strand_angle)
-
-                dz_to_strand = dist_to_ring - abs(strand_offset_z)
-                dist_to_strand = abs(dz_to_strand)
-
-                strand_influence = math.exp(
-                    -(dist_to_strand ** 2) / (STRAND_RADIUS * 0.8) ** 2
-                )
-                strand_height = (
-                    rope_depth + strand_offset_radial
-                    + STRAND_RADIUS * strand_influence
-                )
-
-                strand_heights.append(strand_height)
-                strand_influences.append(strand_influence)
-
-            # Blend strands
-            max_strand = max(strand_heights)
-            total_influence = sum(strand_influences)
-            weighted_avg = (
-                sum(h * inf for h, inf in zip(strand_heights, strand_influences))
-                / (total_influence + 0.001)
-            )
-            blended_height = (1.0 - smoothing) * max_strand + smoothing * weighted_avg
-
-            # Rope envelope
-            rope_envelope = math.exp(
-                -(dist_to_ring ** 2) / (rope_width / 3.0) ** 2
-            )
-            rope_base = rope_depth * rope_envelope
-            contribution = max(blended_height * rope_envelope, rope_base)
-
-            ring_pattern[j, d_idx] = contribution
+    ring_pattern = _ring_pattern(sin_twist, cos_twist, dist_steps, params)
 
     # Now apply the pre-calculated pattern to all grid points
-    z_1d = np.linspace(0, width, axial_steps)
-    theta_1d_grid = np.linspace(0, 2.0 * math.pi, angular_steps, endpoint=False)
-    z_grid, theta_grid = np.meshgrid(z_1d, theta_1d_grid, indexing='ij')
-
     # Start with background
-    displacement = _generate_background(z_grid, theta_grid)
+    displacement = _generate_background(z_grid, theta_grid).astype(DTYPE)
 
     # For each ring, look up the pre-calculated pattern by distance
-    for wrap_idx in range(num_wraps):
-        wrap_z = (wrap_idx + 0.5) * z_step
-
-        for i in range(axial_steps):
-            z = z_1d[i]
-            dist_to_ring = abs(z - wrap_z)
-
-            if dist_to_ring >= max_dist:
-                continue
-
-            # Look up in pre-calculated pattern (0.5mm resolution)
-            dist_key = round(dist_to_ring * 2.0)  # Convert to index
-            if dist_key >= num_dist_steps:
-                continue
-
-            for j in range(angular_steps):
-                height = ring_pattern[j, dist_key]
-                if height > displacement[i, j]:
-                    displacement[i, j] = height
+    # Shape: (num_wraps,) ring centers, (num_wraps, axial_steps) distances
+    wrap_z = (np.arange(num_wraps) + 0.5) * z_step
+    dist_to_ring = np.abs(z_1d[np.newaxis, :] - wrap_z[:, np.newaxis])
+
+    # Look up in pre-calculated pattern (0.5mm resolution)
+    dist_keys = np.rint(dist_to_ring * 2.0).astype(np.int64)  # Convert to index
+    valid = (dist_to_ring < max_dist) & (dist_keys < num_dist_steps)
+    dist_keys[~valid] = 0
+
+    # ring_heights[j, w, i] = ring w's height at angular j, axial i
+    ring_heights = ring_pattern[:, dist_keys]
+    ring_heights[:, ~valid] = -np.inf
+
+    # Strongest ring at each grid point, transposed to (axial, angular)
+    ring_max = np.max(ring_heights, axis=1).T
+    np.maximum(displacement, ring_max, out=displacement)
 
     return displacement
@@ -12,11 +12,23 @@ The process:
   5. Write binary STL format with settings embedded in the header
 """
 
+import functools
 import struct
 import numpy as np
-import math
 from pathlib import Path
 from .parameters import RollerParams, RADIUS
+from .pattern_generator import coordinate_grids
+
+
+# One binary STL triangle record: normal + 3 vertices + attribute (50 bytes)
+_STL_TRIANGLE_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('v1', '<f4', (3,)),
+    ('v2', '<f4', (3,)),
+    ('v3', '<f4', (3,)),
+    ('attr', '<u2'),
+])
+assert _STL_TRIANGLE_DTYPE.itemsize == 50  # packed, no alignment padding
 
 
 def generate_stl(
@@ -86,19 +98,18 @@ def _generate_vertices(
     Returns:
         Array of shape (axial_steps * angular_steps, 3) containing [x, y, z] vertices.
     """
-    # Create coordinate arrays
-    z_1d = np.linspace(0, width, axial_steps)
-    theta_1d = np.linspace(0, 2.0 * math.pi, angular_steps, endpoint=False)
-
-    # Build grids
-    z_grid, theta_grid = np.meshgrid(z_1d, theta_1d, indexing='ij')
+    # Coordinate grids (shared with the pattern generator, cached)
+    _, _, z_grid, _, cos_theta, sin_theta = coordinate_grids(
+        width, axial_steps, angular_steps
+    )
 
     # Calculate radius at each point
     r_grid = RADIUS - displacement
 
     # Convert to Cartesian coordinates
-    x_grid = r_grid * np.cos(theta_grid)
-    y_grid = r_grid * np.sin(theta_grid)
+    # (cos/sin are per column, broadcast down the rows)
+    x_grid = r_grid * cos_theta[np.newaxis, :]
+    y_grid = r_grid * sin_theta[np.newaxis, :]
 
     # Flatten into vertex list: shape (num_vertices, 3)
     vertices = np.column_stack([
@@ -110,11 +121,14 @@ def _generate_vertices(
     return vertices
 
 
+@functools.lru_cache(maxsize=4)
 def _generate_faces(axial_steps: int, angular_steps: int) -> np.ndarray:
     """Generate triangle face indices connecting the vertex grid.
 
     Each cell in the grid becomes two triangles. The last column
     wraps around to connect with the first column (seam closure).
+    The topology depends only on the grid size, so results are cached
+    and returned read-only.
 
     Args:
         axial_steps: Number of rows.
@@ -123,52 +137,50 @@ def _generate_faces(axial_steps: int, angular_steps: int) -> np.ndarray:
     Returns:
         Array of shape (num_faces, 3) containing vertex indices.
     """
-    faces = []
-
-    for i in range(axial_steps - 1):
-        for j in range(angular_steps - 1):
-            # Regular quad → 2 triangles
-            v1 = i * angular_steps + j
-            v2 = i * angular_steps + (j + 1)
-            v3 = (i + 1) * angular_steps + j
-            v4 = (i + 1) * angular_steps + (j + 1)
+    # Row/column index of each quad's lower-left vertex
+    i = np.arange(axial_steps - 1)[:, np.newaxis]
+    j = np.arange(angular_steps)[np.newaxis, :]
 
-            faces.append([v1, v2, v3])
-            faces.append([v2, v4, v3])
+    # Wrap-around: the last column connects back to the first column
+    j_next = (j + 1) % angular_steps
 
-        # Wrap-around: connect last column to first column
-        j = angular_steps - 1
-        v1 = i * angular_steps + j
-        v2 = i * angular_steps + 0
-        v3 = (i + 1) * angular_steps + j
-        v4 = (i + 1) * angular_steps + 0
+    # Quad corners → shape (axial_steps - 1, angular_steps)
+    v1 = i * angular_steps + j
+    v2 = i * angular_steps + j_next
+    v3 = (i + 1) * angular_steps + j
+    v4 = (i + 1) * angular_steps + j_next
 
-        faces.append([v1, v2, v3])
-        faces.append([v2, v4, v3])
+    # 2 triangles per quad, kept in row-major order: [v1, v2, v3], [v2, v4, v3]
+    faces = np.stack([
+        np.stack([v1, v2, v3], axis=-1),
+        np.stack([v2, v4, v3], axis=-1),
+    ], axis=-2)
 
-    return np.array(faces, dtype=np.int32)
+    faces = faces.reshape(-1, 3).astype(np.int32)
+    faces.setflags(write=False)
+    return faces
 
 
-def _calculate_normal(v1: np.ndarray, v2: np.ndarray, v3: np.ndarray) -> np.ndarray:
-    """Calculate the outward-facing unit normal for a triangle.
+def _calculate_normals(v1: np.ndarray, v2: np.ndarray, v3: np.ndarray) -> np.ndarray:
+    """Calculate the outward-facing unit normal for every triangle.
 
     Uses the cross product of two edges to find the perpendicular direction.
+    Degenerate (zero-area) triangles keep a zero normal.
 
     Args:
-        v1, v2, v3: The three vertices of the triangle (each shape (3,)).
+        v1, v2, v3: The three vertices of each triangle (each shape (M, 3)).
 
     Returns:
-        Unit normal vector, shape (3,).
+        Unit normal vectors, shape (M, 3).
     """
     edge1 = v2 - v1
     edge2 = v3 - v1
-    normal = np.cross(edge1, edge2)
+    normals = np.cross(edge1, edge2)
 
-    length = np.linalg.norm(normal)
-    if length > 0:
-        normal = normal / length
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
 
-    return normal
+    return normals
 
 
 def _write_binary_stl(
@@ -199,7 +211,7 @@ def _write_binary_stl(
     num_triangles = len(faces)
 
     # Total size: 80 (header) + 4 (count) + 50 per triangle
-    buffer_size = 84 + num_triangles * 50
+    buffer_size = 84 + num_triangles * _STL_TRIANGLE_DTYPE.itemsize
     data = bytearray(buffer_size)
 
     # ---- Header (80 bytes) ----
@@ -212,24 +224,19 @@ def _write_binary_stl(
     struct.pack_into('<I', data, 80, num_triangles)
 
     # ---- Triangles ----
-    offset = 84
-    for face in faces:
-        v1 = vertices[face[0]]
-        v2 = vertices[face[1]]
-        v3 = vertices[face[2]]
-
-        normal = _calculate_normal(v1, v2, v3)
-
-        # Pack: normal (3 floats) + 3 vertices (9 floats) + attribute (1 uint16)
-        struct.pack_into('<3f', data, offset, *normal)
-        offset += 12
-        struct.pack_into('<3f', data, offset, *v1)
-        offset += 12
-        struct.pack_into('<3f', data, offset, *v2)
-        offset += 12
-        struct.pack_into('<3f', data, offset, *v3)
-        offset += 12
-        struct.pack_into('<H', data, offset, 0)
-        offset += 2
+    # Gather all three vertices of every triangle at once: shape (M, 3, 3)
+    tri_verts = vertices.astype(np.float32, copy=False)[faces]
+    v1 = tri_verts[:, 0]
+    v2 = tri_verts[:, 1]
+    v3 = tri_verts[:, 2]
+
+    # Triangle records are written straight into the output buffer
+    # (a structured view over it), so no separate copy is serialized
+    triangles = np.frombuffer(data, dtype=_STL_TRIANGLE_DTYPE, offset=84)
+    triangles['normal'] = _calculate_normals(v1, v2, v3)
+    triangles['v1'] = v1
+    triangles['v2'] = v2
+    triangles['v3'] = v3
+    # Attribute byte count stays 0 (bytearray starts zeroed)
 
     return bytes(data)
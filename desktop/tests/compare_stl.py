@@ -8,52 +8,102 @@ Reads the binary STL data and compares:
 - Vertex position differences (if same triangle count)
 """
 
-import struct
 import os
 import sys
 
+import numpy as np
+
+
+# One binary STL triangle record: normal, 3 vertices, attribute (50 bytes)
+TRI_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('verts', '<f4', (3, 3)),
+    ('attr', '<u2'),
+])
+assert TRI_DTYPE.itemsize == 50
 
-def read_stl_info(filepath):
-    """Read basic info from a binary STL file."""
-    with open(filepath, 'rb') as f:
-        data = f.read()
+
+def read_stl_header(filepath):
+    """Read the header info of a binary STL file, deferring vertex parsing.
+
+    Returns a dict with filepath, filesize, header, tri_count,
+    triangle_data and parse_vertices. triangle_data is the raw triangle
+    payload (uint8). parse_vertices() returns the vertices; it is only
+    called once the caller knows it needs them.
+    """
+    # Memory-map the file so only the pages actually parsed are read in
+    data = np.memmap(filepath, dtype=np.uint8, mode='r')
 
     # Header (80 bytes) - read as string, stop at first null
-    header_bytes = data[0:80]
+    header_bytes = bytes(data[0:80])
     header = header_bytes.split(b'\x00')[0].decode('ascii', errors='replace')
 
     # Triangle count
-    tri_count = struct.unpack_from('<I', data, 80)[0]
-
-    # Read all vertex positions
-    vertices = []
-    offset = 84
-    for i in range(tri_count):
-        # Skip normal (12 bytes), read 3 vertices (36 bytes), skip attribute (2 bytes)
-        nx, ny, nz = struct.unpack_from('<3f', data, offset)
-        v1 = struct.unpack_from('<3f', data, offset + 12)
-        v2 = struct.unpack_from('<3f', data, offset + 24)
-        v3 = struct.unpack_from('<3f', data, offset + 36)
-        vertices.extend([v1, v2, v3])
-        offset += 50
+    tri_count = int(data[80:84].view('<u4')[0])
+
+    def parse_vertices():
+        # Read all triangles in one pass; keep just the vertex positions
+        # (normals and attribute bytes are ignored). The field is left as
+        # (tri_count, 3, 3): reshaping to rows of 3 would force a copy,
+        # since the stride jumps from 12 to 50 bytes between triangles.
+        tris = np.frombuffer(data, dtype=TRI_DTYPE, count=tri_count, offset=84)
+        return tris['verts']
 
     return {
         'filepath': filepath,
-        'filesize': len(data),
+        'filesize': data.size,
         'header': header,
         'tri_count': tri_count,
-        'vertices': vertices,
+        'triangle_data': data[84:84 + tri_count * TRI_DTYPE.itemsize],
+        'parse_vertices': parse_vertices,
     }
 
 
+def read_stl_info(filepath):
+    """Read basic info from a binary STL file.
+
+    Same as read_stl_header, plus vertices: a (tri_count, 3, 3) float32
+    array (triangle, corner, xyz) that is a zero-copy strided view of the
+    memory-mapped file, in file order.
+    """
+    info = read_stl_header(filepath)
+    info['vertices'] = info['parse_vertices']()
+    return info
+
+
+def diff_stats(a, b, chunk_rows=4096):
+    """Return (max, sum) of |a - b| over two equally shaped arrays.
+
+    Works through the arrays in cache-sized blocks of rows (along the
+    first axis) so max and sum both read a block that is still in cache,
+    and no full-size diff array is ever allocated. The inputs may be
+    strided views, e.g. the vertex field of the mapped STL records.
+    """
+    block = np.empty((min(chunk_rows, len(a)),) + a.shape[1:], dtype=np.float32)
+    max_diff = 0.0
+    total_diff = 0.0
+
+    for start in range(0, len(a), chunk_rows):
+        a_rows = a[start:start + chunk_rows]
+        d = block[:len(a_rows)]
+        np.subtract(a_rows, b[start:start + chunk_rows], out=d)
+        np.abs(d, out=d)
+        # nanmax skips NaN coordinates; a block max would be NaN, and
+        # max() would then discard that block's real maximum with it
+        max_diff = max(max_diff, float(np.nanmax(d)))
+        total_diff += float(d.sum(dtype=np.float64))
+
+    return max_diff, total_diff
+
+
 def compare_files(desktop_path, web_path, label):
     """Compare two STL files and report differences."""
     print(f"\n{'=' * 60}")
     print(f"COMPARING: {label}")
     print(f"{'=' * 60}")
 
-    desktop = read_stl_info(desktop_path)
-    web = read_stl_info(web_path)
+    desktop = read_stl_header(desktop_path)
+    web = read_stl_header(web_path)
 
     print(f"\n  Desktop: {os.path.basename(desktop_path)}")
     print(f"    Header:    '{desktop['header']}'")
@@ -76,18 +126,19 @@ def compare_files(desktop_path, web_path, label):
     if desktop['tri_count'] == web['tri_count']:
         print(f"  Triangle counts: IDENTICAL ({desktop['tri_count']:,})")
 
-        # Compare actual vertex positions
-        max_diff = 0
-        total_diff = 0
-        num_verts = len(desktop['vertices'])
-
-        for i in range(num_verts):
-            dv = desktop['vertices'][i]
-            wv = web['vertices'][i]
-            for k in range(3):
-                diff = abs(dv[k] - wv[k])
-                max_diff = max(max_diff, diff)
-                total_diff += diff
+        num_verts = desktop['tri_count'] * 3
+
+        # Byte-identical triangle data needs no per-vertex comparison
+        if np.array_equal(desktop['triangle_data'], web['triangle_data']):
+            print(f"  Vertex comparison ({num_verts:,} vertices):")
+            print(f"    Triangle data: BYTE-IDENTICAL")
+            print(f"    Result: EFFECTIVELY IDENTICAL")
+            return
+
+        # Compare actual vertex positions (per coordinate)
+        max_diff, total_diff = diff_stats(
+            desktop['parse_vertices'](), web['parse_vertices']()
+        )
 
         avg_diff = total_diff / (num_verts * 3) if num_verts > 0 else 0
         print(f"  Vertex comparison ({num_verts:,} vertices):")
@@ -6,11 +6,17 @@ modes, then reports basic stats so we can verify the output is reasonable.
 
 Run from the repo root:
     python desktop/tests/test_stl_generation.py
+
+Or keep one process (with numpy and the core modules already imported)
+running and enter a mode per line on stdin:
+    python desktop/tests/test_stl_generation.py --repl
 """
 
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Add the desktop folder to Python's path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -20,13 +26,24 @@ from core.pattern_generator import generate_displacement_map
 from core.stl_generator import generate_stl
 
 
-def test_spiral_mode():
-    """Generate a spiral mode STL with default parameters."""
+def run_mode(mode, params=None, io_pool=None):
+    """Generate an STL for one mode (default parameters unless given).
+
+    Prints progress as it goes and returns a dict of basic stats, plus
+    the displacement map and STL bytes for further inspection.
+
+    If io_pool (an executor) is given, the file write is submitted to it
+    so the caller can start the next mode while the file is written; the
+    returned dict then holds the pending 'write_future'.
+    """
     print("=" * 60)
-    print("TEST: Spiral Mode (default parameters)")
+    if params is None:
+        print(f"TEST: {mode.capitalize()} Mode (default parameters)")
+        params = RollerParams(mode=mode)
+    else:
+        print(f"TEST: {mode.capitalize()} Mode (custom parameters)")
     print("=" * 60)
 
-    params = RollerParams(mode="spiral")
     print(f"  Parameters: {params}")
     print(f"  Filename will be: {params.to_filename()}")
     print()
@@ -35,8 +52,8 @@ def test_spiral_mode():
     print("  Generating displacement map...")
     start = time.time()
     displacement = generate_displacement_map(params)
-    elapsed = time.time() - start
-    print(f"  Done in {elapsed:.2f} seconds")
+    pattern_seconds = time.time() - start
+    print(f"  Done in {pattern_seconds:.2f} seconds")
     print(f"  Grid size: {displacement.shape[0]} x {displacement.shape[1]}")
     print(f"  Displacement range: {displacement.min():.3f} to {displacement.max():.3f} mm")
     print()
@@ -48,48 +65,57 @@ def test_spiral_mode():
 
     print("  Generating STL file...")
     start = time.time()
-    stl_data = generate_stl(displacement, params, output_path)
-    elapsed = time.time() - start
-    print(f"  Done in {elapsed:.2f} seconds")
+    stl_data = generate_stl(displacement, params)
+    stl_seconds = time.time() - start
+    print(f"  Done in {stl_seconds:.2f} seconds")
     print(f"  File size: {len(stl_data):,} bytes ({len(stl_data) / 1024 / 1024:.1f} MB)")
-    print(f"  Saved to: {output_path}")
+
+    # Write the file (in the background if an I/O pool was given)
+    write_future = None
+    if io_pool is not None:
+        write_future = io_pool.submit(Path(output_path).write_bytes, stl_data)
+        print(f"  Saving to: {output_path}")
+    else:
+        Path(output_path).write_bytes(stl_data)
+        print(f"  Saved to: {output_path}")
     print()
 
+    return {
+        'mode': mode,
+        'grid_shape': displacement.shape,
+        'displacement_min': float(displacement.min()),
+        'displacement_max': float(displacement.max()),
+        'pattern_seconds': pattern_seconds,
+        'stl_seconds': stl_seconds,
+        'file_size': len(stl_data),
+        'output_path': output_path,
+        'displacement': displacement,
+        'stl_data': stl_data,
+        'write_future': write_future,
+    }
 
-def test_tangent_mode():
-    """Generate a tangent mode STL with default parameters."""
-    print("=" * 60)
-    print("TEST: Tangent Mode (default parameters)")
-    print("=" * 60)
 
-    params = RollerParams(mode="tangent")
-    print(f"  Parameters: {params}")
-    print(f"  Filename will be: {params.to_filename()}")
-    print()
+def test_spiral_mode():
+    """Generate a spiral mode STL with default parameters."""
+    run_mode("spiral")
 
-    # Generate displacement map
-    print("  Generating displacement map...")
-    start = time.time()
-    displacement = generate_displacement_map(params)
-    elapsed = time.time() - start
-    print(f"  Done in {elapsed:.2f} seconds")
-    print(f"  Grid size: {displacement.shape[0]} x {displacement.shape[1]}")
-    print(f"  Displacement range: {displacement.min():.3f} to {displacement.max():.3f} mm")
-    print()
 
-    # Generate STL
-    output_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'test_output')
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, params.to_filename())
+def test_tangent_mode():
+    """Generate a tangent mode STL with default parameters."""
+    run_mode("tangent")
 
-    print("  Generating STL file...")
-    start = time.time()
-    stl_data = generate_stl(displacement, params, output_path)
-    elapsed = time.time() - start
-    print(f"  Done in {elapsed:.2f} seconds")
-    print(f"  File size: {len(stl_data):,} bytes ({len(stl_data) / 1024 / 1024:.1f} MB)")
-    print(f"  Saved to: {output_path}")
-    print()
+
+def repl():
+    """Run one mode per stdin line until a blank line or EOF."""
+    print("Enter a mode (spiral or tangent) per line; blank line to quit.")
+    while line := sys.stdin.readline():
+        mode = line.strip()
+        if not mode:
+            break
+        if mode not in ("spiral", "tangent"):
+            print(f"  Unknown mode: {mode!r}")
+            continue
+        run_mode(mode)
 
 
 if __name__ == "__main__":
@@ -97,8 +123,16 @@ if __name__ == "__main__":
     print("Rope Roller Maker - STL Generation Test")
     print()
 
-    test_spiral_mode()
-    test_tangent_mode()
+    if "--repl" in sys.argv[1:]:
+        repl()
+        sys.exit(0)
+
+    # Each STL file is written on a background thread while the next
+    # mode is generated; wait for all writes before reporting completion
+    with ThreadPoolExecutor(max_workers=1) as io_pool:
+        results = [run_mode(mode, io_pool=io_pool) for mode in ("spiral", "tangent")]
+        for result in results:
+            result['write_future'].result()
 
     print("=" * 60)
     print("ALL TESTS COMPLETE")